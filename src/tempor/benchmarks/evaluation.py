@@ -2,13 +2,14 @@
 
 import copy
 import warnings
-from time import time
-from typing import TYPE_CHECKING, Any, Dict, List, Tuple, cast
+from time import perf_counter_ns
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, cast
 
+import joblib
 import numpy as np
+import omegaconf
 import pandas as pd
 import pydantic
-import scipy.stats
 import sklearn.metrics
 import sklearn.model_selection
 from typing_extensions import Literal, get_args
@@ -78,55 +79,137 @@ output_metrics = get_args(OutputMetric)
 
 class _InternalScores(pydantic.BaseModel):
     metrics: Dict[str, np.ndarray] = {}  # np.ndarray expected to be 1D, contain floats.
-    errors: List[int] = []
-    durations: List[float] = []
+    errors: np.ndarray  # 1D int array of length n_splits, 1 where the fold errored.
+    durations: np.ndarray  # 1D float array of length n_splits, fold durations in seconds.
     model_config = pydantic.ConfigDict(arbitrary_types_allowed=True)
 
 
-@pydantic_utils.validate_arguments(config=pydantic.ConfigDict(arbitrary_types_allowed=True))
+def _clone_estimator(estimator: Any) -> Any:
+    """Create an unfitted copy of ``estimator`` for a cross-validation fold.
+
+    Estimators following the `~tempor.methods.core.BaseEstimator` convention hold all their hyperparameters in the
+    ``params`` attribute, so a fresh instance can be constructed from those - much cheaper than `copy.deepcopy`
+    traversing the full object graph. Falls back to `copy.deepcopy` for estimators without ``params``, or ones
+    carrying extra instance state that construction would not reproduce.
+    """
+    params = getattr(estimator, "params", None)
+    if isinstance(params, omegaconf.DictConfig):
+        fresh = type(estimator)(**cast(Dict, omegaconf.OmegaConf.to_container(params)))
+        if fresh.__dict__.keys() == estimator.__dict__.keys():
+            return fresh
+    return copy.deepcopy(estimator)
+
+
+def _evaluate_classifier_fold(
+    estimator: Any,
+    train_data: dataset.PredictiveDataset,
+    test_data: dataset.PredictiveDataset,
+    test_labels: np.ndarray,
+    metrics: Dict[str, metric_module.OneOffClassificationMetric],
+    raise_exceptions: bool,
+) -> Tuple[Dict[str, float], int, float]:
+    """Run a single classifier cross-validation fold: clone, fit, predict and evaluate ``metrics``.
+
+    Returns ``(scores, error, duration)``: the per-metric scores, the error flag (``1`` if the fold failed and
+    ``raise_exceptions`` is `False`), and the fold duration in seconds.
+    """
+    model = _clone_estimator(estimator)
+    start = perf_counter_ns()
+    scores: Dict[str, float] = {}
+    error = 0
+
+    try:
+        model.fit(train_data)
+
+        preds = model.predict_proba(test_data).numpy()
+
+        for metric_name, metric in metrics.items():
+            scores[metric_name] = metric.evaluate(test_labels, preds)
+
+    except BaseException as e:  # pylint: disable=broad-except
+        logger.error(f"Evaluation failed: {e}")
+        error = 1
+        if raise_exceptions:
+            raise
+
+    return scores, error, (perf_counter_ns() - start) * 1e-9
+
+
+def _evaluate_regressor_fold(
+    estimator: Any,
+    train_data: dataset.PredictiveDataset,
+    test_data: dataset.PredictiveDataset,
+    targets: np.ndarray,
+    metrics: Dict[str, metric_module.OneOffRegressionMetric],
+    raise_exceptions: bool,
+) -> Tuple[Dict[str, float], int, float]:
+    """Run a single regressor cross-validation fold: clone, fit, predict and evaluate ``metrics``.
+
+    Returns ``(scores, error, duration)``: the per-metric scores, the error flag (``1`` if the fold failed and
+    ``raise_exceptions`` is `False`), and the fold duration in seconds.
+    """
+    model = _clone_estimator(estimator)
+    start = perf_counter_ns()
+    scores: Dict[str, float] = {}
+    error = 0
+
+    try:
+        model.fit(train_data)
+
+        preds = model.predict(test_data).numpy().squeeze()
+
+        for metric_name, metric in metrics.items():
+            scores[metric_name] = metric.evaluate(targets, preds)
+
+    except BaseException as e:  # pylint: disable=broad-except
+        logger.error(f"Regression evaluation failed: {e}")
+        error = 1
+        if raise_exceptions:
+            raise
+
+    return scores, error, (perf_counter_ns() - start) * 1e-9
+
+
 def _postprocess_results(results: _InternalScores) -> pd.DataFrame:
-    output = pd.DataFrame([], columns=output_metrics)
+    # Collect one row per metric and construct the dataframe in one go at the end,
+    # rather than `pd.concat`-ing (and hence reallocating) the frame per metric.
+    rows = []
+    index = []
+
+    errors = np.sum(results.errors)
+    durations = utils.print_score(utils.generate_score(results.durations))
 
     for metric in results.metrics:
         values = results.metrics[metric]
-        errors = np.sum(results.errors)
-        durations = utils.print_score(utils.generate_score(np.asarray(results.durations)))
 
-        score_min = np.min(values)
-        score_max = np.max(values)
+        # Each statistic is a single C-level pass over the values.
+        q1, score_median, q3 = np.quantile(values, (0.25, 0.5, 0.75))
+
+        score_min = values.min()
+        score_max = values.max()
         score_mean = np.mean(values)
-        score_median = np.median(values)
         score_stddev = np.std(values)
-        score_iqr = scipy.stats.iqr(values)
+        score_iqr = q3 - q1
         score_rounds = len(values)
 
-        output = pd.concat(
+        rows.append(
             [
-                output,
-                pd.DataFrame(
-                    [
-                        [
-                            score_min,
-                            score_max,
-                            score_mean,
-                            score_stddev,
-                            score_median,
-                            score_iqr,
-                            score_rounds,
-                            errors,
-                            durations,
-                        ]
-                    ],
-                    columns=output_metrics,
-                    index=[metric],
-                ),
-            ],
+                score_min,
+                score_max,
+                score_mean,
+                score_stddev,
+                score_median,
+                score_iqr,
+                score_rounds,
+                errors,
+                durations,
+            ]
         )
+        index.append(metric)
 
-    return output
+    return pd.DataFrame(rows, columns=output_metrics, index=index)
 
 
-@pydantic_utils.validate_arguments(config=pydantic.ConfigDict(arbitrary_types_allowed=True))
 def evaluate_prediction_oneoff_classifier(  # pylint: disable=unused-argument
     estimator: Any,
     data: dataset.PredictiveDataset,
@@ -134,6 +217,8 @@ def evaluate_prediction_oneoff_classifier(  # pylint: disable=unused-argument
     random_state: int = 0,
     raise_exceptions: bool = False,
     silence_warnings: bool = False,
+    metrics_to_evaluate: Optional[List[str]] = None,
+    n_jobs: int = 1,
     **kwargs: Any,
 ) -> pd.DataFrame:
     """Helper for evaluating classifiers.
@@ -153,6 +238,14 @@ def evaluate_prediction_oneoff_classifier(  # pylint: disable=unused-argument
             dataframe. Defaults to `False`.
         silence_warnings (bool, optional):
             Whether to silence warnings raised. Defaults to `False`.
+        metrics_to_evaluate (Optional[List[str]], optional):
+            A subset of the registered metric names to evaluate. If `None`, all registered metrics are evaluated.
+            Defaults to `None`.
+        n_jobs (int, optional):
+            Number of jobs to run the cross-validation folds in, passed to `joblib.Parallel`. ``1`` runs the folds
+            sequentially in the current process, ``-1`` uses all available cores. Note that the
+            `~tempor.models.utils.enable_reproducibility` seeding does not propagate to parallel workers, so results
+            obtained with ``n_jobs != 1`` are not seed-reproducible. Defaults to ``1``.
         **kwargs (Any):
             Currently unused.
 
@@ -170,10 +263,28 @@ def evaluate_prediction_oneoff_classifier(  # pylint: disable=unused-argument
 
     """
 
+    if not isinstance(data, dataset.PredictiveDataset):
+        raise TypeError(f"Expected `data` to be a `{dataset.PredictiveDataset.__name__}` but was {type(data)}")
+
     # For the sake of import modularity, do not use the global plugin loader here, but create own:
     _plugin_loader = plugins.PluginLoader()
     metric_plugin_category = "prediction.one_off.classification"
     supported_metrics = _plugin_loader.list(plugin_type="metric")["prediction"]["one_off"]["classification"]
+    if metrics_to_evaluate is not None:
+        unknown_metrics = set(metrics_to_evaluate) - set(supported_metrics)
+        if unknown_metrics:
+            raise ValueError(
+                f"Unknown metric(s) requested: {sorted(unknown_metrics)}. Supported metrics: {supported_metrics}"
+            )
+        supported_metrics = list(metrics_to_evaluate)
+    # Resolve the metric plugins once, rather than per fold per metric.
+    metrics: Dict[str, metric_module.OneOffClassificationMetric] = {
+        metric_name: cast(
+            metric_module.OneOffClassificationMetric,
+            _plugin_loader.get(f"{metric_plugin_category}.{metric_name}", plugin_type="metric"),
+        )
+        for metric_name in supported_metrics
+    }
 
     with warnings.catch_warnings():
         if silence_warnings:
@@ -184,7 +295,10 @@ def evaluate_prediction_oneoff_classifier(  # pylint: disable=unused-argument
         estimator_ = cast("BaseOneOffClassifier", estimator)
         enable_reproducibility(random_state)
 
-        results = _InternalScores()
+        results = _InternalScores(
+            errors=np.zeros(n_splits, dtype=np.int8),
+            durations=np.zeros(n_splits, dtype=np.float64),
+        )
         for metric_name in supported_metrics:
             results.metrics[metric_name] = np.zeros(n_splits)
 
@@ -196,41 +310,24 @@ def evaluate_prediction_oneoff_classifier(  # pylint: disable=unused-argument
         if len(labels.shape) > 1:
             raise ValueError("Classifier evaluation expects 1D output")
 
-        indx = 0
-        for train_data, test_data in data.split(splitter=splitter, y=labels):
-            model = copy.deepcopy(estimator_)
-            start = time()
-
-            try:
-                model.fit(train_data)
-
-                if TYPE_CHECKING:  # pragma: no cover
-                    assert test_data.predictive.targets is not None  # nosec B101
-                test_labels = test_data.predictive.targets.numpy()
-                preds = model.predict_proba(test_data).numpy()
-
-                for metric_name in supported_metrics:
-                    metric = cast(
-                        metric_module.OneOffClassificationMetric,
-                        _plugin_loader.get(f"{metric_plugin_category}.{metric_name}", plugin_type="metric"),
-                    )
-                    results.metrics[metric_name][indx] = metric.evaluate(test_labels, preds)
-
-                results.errors.append(0)
-
-            except BaseException as e:  # pylint: disable=broad-except
-                logger.error(f"Evaluation failed: {e}")
-                results.errors.append(1)
-                if raise_exceptions:
-                    raise
-
-            results.durations.append(time() - start)
-            indx += 1
+        # Iterate over fold indices directly (rather than `data.split`), so that cached numpy arrays such as
+        # `labels` can be sliced per fold instead of re-materialized from the split subsets.
+        # The folds are independent, so they can be run in parallel workers when `n_jobs != 1`.
+        fold_results = joblib.Parallel(n_jobs=n_jobs)(
+            joblib.delayed(_evaluate_classifier_fold)(
+                estimator_, data[train_idx], data[test_idx], labels[test_idx], metrics, raise_exceptions
+            )
+            for train_idx, test_idx in splitter.split(np.arange(len(data)), labels)
+        )
+        for indx, (scores, error, duration) in enumerate(fold_results):
+            for metric_name, score in scores.items():
+                results.metrics[metric_name][indx] = score
+            results.errors[indx] = error
+            results.durations[indx] = duration
 
     return _postprocess_results(results)
 
 
-@pydantic_utils.validate_arguments(config=pydantic.ConfigDict(arbitrary_types_allowed=True))
 def evaluate_prediction_oneoff_regressor(  # pylint: disable=unused-argument
     estimator: Any,
     data: dataset.PredictiveDataset,
@@ -238,6 +335,8 @@ def evaluate_prediction_oneoff_regressor(  # pylint: disable=unused-argument
     random_state: int = 0,
     raise_exceptions: bool = False,
     silence_warnings: bool = False,
+    metrics_to_evaluate: Optional[List[str]] = None,
+    n_jobs: int = 1,
     **kwargs: Any,
 ) -> pd.DataFrame:
     """Helper for evaluating regression tasks.
@@ -257,6 +356,14 @@ def evaluate_prediction_oneoff_regressor(  # pylint: disable=unused-argument
             dataframe. Defaults to `False`.
         silence_warnings (bool, optional):
             Whether to silence warnings raised. Defaults to `False`.
+        metrics_to_evaluate (Optional[List[str]], optional):
+            A subset of the registered metric names to evaluate. If `None`, all registered metrics are evaluated.
+            Defaults to `None`.
+        n_jobs (int, optional):
+            Number of jobs to run the cross-validation folds in, passed to `joblib.Parallel`. ``1`` runs the folds
+            sequentially in the current process, ``-1`` uses all available cores. Note that the
+            `~tempor.models.utils.enable_reproducibility` seeding does not propagate to parallel workers, so results
+            obtained with ``n_jobs != 1`` are not seed-reproducible. Defaults to ``1``.
         **kwargs (Any):
             Currently unused.
 
@@ -274,10 +381,28 @@ def evaluate_prediction_oneoff_regressor(  # pylint: disable=unused-argument
 
     """
 
+    if not isinstance(data, dataset.PredictiveDataset):
+        raise TypeError(f"Expected `data` to be a `{dataset.PredictiveDataset.__name__}` but was {type(data)}")
+
     # For the sake of import modularity, do not use the global plugin loader here, but create own:
     _plugin_loader = plugins.PluginLoader()
     metric_plugin_category = "prediction.one_off.regression"
     supported_metrics = _plugin_loader.list(plugin_type="metric")["prediction"]["one_off"]["regression"]
+    if metrics_to_evaluate is not None:
+        unknown_metrics = set(metrics_to_evaluate) - set(supported_metrics)
+        if unknown_metrics:
+            raise ValueError(
+                f"Unknown metric(s) requested: {sorted(unknown_metrics)}. Supported metrics: {supported_metrics}"
+            )
+        supported_metrics = list(metrics_to_evaluate)
+    # Resolve the metric plugins once, rather than per fold per metric.
+    metrics: Dict[str, metric_module.OneOffRegressionMetric] = {
+        metric_name: cast(
+            metric_module.OneOffRegressionMetric,
+            _plugin_loader.get(f"{metric_plugin_category}.{metric_name}", plugin_type="metric"),
+        )
+        for metric_name in supported_metrics
+    }
 
     with warnings.catch_warnings():
         if silence_warnings:
@@ -288,42 +413,33 @@ def evaluate_prediction_oneoff_regressor(  # pylint: disable=unused-argument
         estimator_ = cast("BaseOneOffRegressor", estimator)
         enable_reproducibility(random_state)
 
-        results = _InternalScores()
+        results = _InternalScores(
+            errors=np.zeros(n_splits, dtype=np.int8),
+            durations=np.zeros(n_splits, dtype=np.float64),
+        )
         for metric in supported_metrics:
             results.metrics[metric] = np.zeros(n_splits)
 
         splitter = sklearn.model_selection.KFold(n_splits=n_splits, shuffle=True, random_state=random_state)
 
-        indx = 0
-        for train_data, test_data in data.split(splitter=splitter):
-            model = copy.deepcopy(estimator_)
-            start = time()
-
-            try:
-                model.fit(train_data)
-
-                if TYPE_CHECKING:  # pragma: no cover
-                    assert test_data.predictive.targets is not None  # nosec B101
-                targets = test_data.predictive.targets.numpy().squeeze()
-                preds = model.predict(test_data).numpy().squeeze()
-
-                for metric_name in supported_metrics:
-                    metric = cast(
-                        metric_module.OneOffRegressionMetric,
-                        _plugin_loader.get(f"{metric_plugin_category}.{metric_name}", plugin_type="metric"),
-                    )
-                    results.metrics[metric_name][indx] = metric.evaluate(targets, preds)
-
-                results.errors.append(0)
-
-            except BaseException as e:  # pylint: disable=broad-except
-                logger.error(f"Regression evaluation failed: {e}")
-                results.errors.append(1)
-                if raise_exceptions:
-                    raise
-
-            results.durations.append(time() - start)
-            indx += 1
+        if data.predictive.targets is None:
+            raise ValueError("The dataset for evaluation needs to contain targets but did not")
+        all_targets = data.predictive.targets.numpy().squeeze()
+
+        # Iterate over fold indices directly (rather than `data.split`), so that the targets numpy array
+        # materialized above can be sliced per fold instead of re-extracted from the split subsets.
+        # The folds are independent, so they can be run in parallel workers when `n_jobs != 1`.
+        fold_results = joblib.Parallel(n_jobs=n_jobs)(
+            joblib.delayed(_evaluate_regressor_fold)(
+                estimator_, data[train_idx], data[test_idx], all_targets[test_idx], metrics, raise_exceptions
+            )
+            for train_idx, test_idx in splitter.split(np.arange(len(data)))
+        )
+        for indx, (scores, error, duration) in enumerate(fold_results):
+            for metric_name, score in scores.items():
+                results.metrics[metric_name][indx] = score
+            results.errors[indx] = error
+            results.durations[indx] = duration
 
     return _postprocess_results(results)
 
@@ -379,6 +495,7 @@ def evaluate_time_to_event(  # pylint: disable=unused-argument
     random_state: int = 0,
     raise_exceptions: bool = False,
     silence_warnings: bool = False,
+    metrics_to_evaluate: Optional[List[str]] = None,
     **kwargs: Any,
 ) -> pd.DataFrame:
     """Helper for evaluating time-to-event tasks.
@@ -400,6 +517,9 @@ def evaluate_time_to_event(  # pylint: disable=unused-argument
             dataframe. Defaults to `False`.
         silence_warnings (bool, optional):
             Whether to silence warnings raised. Defaults to `False`.
+        metrics_to_evaluate (Optional[List[str]], optional):
+            A subset of the registered metric names to evaluate. If `None`, all registered metrics are evaluated.
+            Defaults to `None`.
         **kwargs (Any):
             Currently unused.
 
@@ -421,6 +541,21 @@ def evaluate_time_to_event(  # pylint: disable=unused-argument
     _plugin_loader = plugins.PluginLoader()
     metric_plugin_category = "time_to_event"
     supported_metrics = _plugin_loader.list(plugin_type="metric")["time_to_event"]
+    if metrics_to_evaluate is not None:
+        unknown_metrics = set(metrics_to_evaluate) - set(supported_metrics)
+        if unknown_metrics:
+            raise ValueError(
+                f"Unknown metric(s) requested: {sorted(unknown_metrics)}. Supported metrics: {supported_metrics}"
+            )
+        supported_metrics = list(metrics_to_evaluate)
+    # Resolve the metric plugins once, rather than per fold per metric.
+    metrics: Dict[str, metric_module.TimeToEventMetric] = {
+        metric_name: cast(
+            metric_module.TimeToEventMetric,
+            _plugin_loader.get(f"{metric_plugin_category}.{metric_name}", plugin_type="metric"),
+        )
+        for metric_name in supported_metrics
+    }
 
     with warnings.catch_warnings():
         if silence_warnings:
@@ -432,7 +567,10 @@ def evaluate_time_to_event(  # pylint: disable=unused-argument
         estimator_ = cast("BaseTimeToEventAnalysis", estimator)
         enable_reproducibility(random_state)
 
-        results = _InternalScores()
+        results = _InternalScores(
+            errors=np.zeros(n_splits, dtype=np.int8),
+            durations=np.zeros(n_splits, dtype=np.float64),
+        )
         for metric in supported_metrics:
             results.metrics[metric] = np.zeros(n_splits)
 
@@ -440,8 +578,8 @@ def evaluate_time_to_event(  # pylint: disable=unused-argument
 
         indx = 0
         for train_data, test_data in data.split(splitter=splitter):
-            model = copy.deepcopy(estimator_)
-            start = time()
+            model = _clone_estimator(estimator_)
+            start = perf_counter_ns()
             try:
                 model.fit(train_data)
 
@@ -454,26 +592,22 @@ def evaluate_time_to_event(  # pylint: disable=unused-argument
                     horizons=horizons,
                     predictions=preds,
                 )
-                for metric_name in supported_metrics:
-                    metric = cast(
-                        metric_module.TimeToEventMetric,
-                        _plugin_loader.get(f"{metric_plugin_category}.{metric_name}", plugin_type="metric"),
-                    )
+                for metric_name, metric in metrics.items():
                     metric_per_horizon = metric.evaluate(
                         (y_test, t_test), predictions_array, horizons, (y_train, t_train)
                     )
                     avg_metric = float(np.asarray(metric_per_horizon).mean())
                     results.metrics[metric_name][indx] = avg_metric
 
-                results.errors.append(0)
+                results.errors[indx] = 0
 
             except BaseException as e:  # pylint: disable=broad-except
                 logger.error(f"Regression evaluation failed: {e}")
-                results.errors.append(1)
+                results.errors[indx] = 1
                 if raise_exceptions:
                     raise
 
-            results.durations.append(time() - start)
+            results.durations[indx] = (perf_counter_ns() - start) * 1e-9
             indx += 1
 
     return _postprocess_results(results)
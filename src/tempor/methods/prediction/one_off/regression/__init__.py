@@ -4,11 +4,10 @@ import abc
 from typing import Any, Tuple
 
 import numpy as np
-import pydantic
 from typing_extensions import Self
 
 import tempor.methods.core as methods_core
-from tempor.core import plugins, pydantic_utils
+from tempor.core import plugins
 from tempor.data import dataset, samples
 
 
@@ -43,14 +42,15 @@ class BaseOneOffRegressor(methods_core.BasePredictor):
         super().fit(data, *args, **kwargs)
         return self
 
-    @pydantic_utils.validate_arguments(config=pydantic.ConfigDict(arbitrary_types_allowed=True))
     def predict(
         self,
         data: dataset.PredictiveDataset,
         *args: Any,
         **kwargs: Any,
     ) -> samples.StaticSamples:  # noqa: D102
-        check_data_class(data)
+        # Fast path: an exact dataset class match needs no further checking.
+        if type(data) is not dataset.OneOffPredictionDataset:  # pylint: disable=unidiomatic-typecheck
+            check_data_class(data)
         return super().predict(data, *args, **kwargs)
 
     @abc.abstractmethod
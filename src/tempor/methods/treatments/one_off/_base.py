@@ -1,11 +1,9 @@
 import abc
 from typing import Any, List
 
-import pydantic
 from typing_extensions import Self
 
 import tempor.methods.core as methods_core
-from tempor.core import pydantic_utils
 from tempor.data import dataset, samples
 
 
@@ -34,14 +32,15 @@ class BaseOneOffTreatmentEffects(methods_core.BasePredictor):
         super().fit(data, *args, **kwargs)
         return self
 
-    @pydantic_utils.validate_arguments(config=pydantic.ConfigDict(arbitrary_types_allowed=True))
     def predict(
         self,
         data: dataset.PredictiveDataset,
         *args: Any,
         **kwargs: Any,
     ) -> samples.StaticSamples:  # noqa: D102
-        check_data_class(data)
+        # Fast path: an exact dataset class match needs no further checking.
+        if type(data) is not dataset.OneOffTreatmentEffectsDataset:  # pylint: disable=unidiomatic-typecheck
+            check_data_class(data)
         return super().predict(data, *args, **kwargs)
 
     @abc.abstractmethod
@@ -50,7 +49,6 @@ class BaseOneOffTreatmentEffects(methods_core.BasePredictor):
     ) -> samples.StaticSamples:  # pragma: no cover
         ...
 
-    @pydantic_utils.validate_arguments(config=pydantic.ConfigDict(arbitrary_types_allowed=True))
     def predict_counterfactuals(
         self,
         data: dataset.PredictiveDataset,
@@ -67,7 +65,9 @@ class BaseOneOffTreatmentEffects(methods_core.BasePredictor):
         Returns:
             List: List of counterfactual predictions.
         """
-        check_data_class(data)
+        # Fast path: an exact dataset class match needs no further checking.
+        if type(data) is not dataset.OneOffTreatmentEffectsDataset:  # pylint: disable=unidiomatic-typecheck
+            check_data_class(data)
         return super().predict_counterfactuals(data, *args, **kwargs)
 
     @abc.abstractmethod
@@ -1,6 +1,6 @@
 """Module with built-in metric plugins for the category: prediction -> one-off -> classification."""
 
-from typing import Any, List, Tuple, cast
+from typing import Any, List, Optional, Tuple, cast
 
 import numpy as np
 import sklearn.metrics
@@ -21,15 +21,181 @@ def _cast_to_y_pred(y_pred_proba: np.ndarray) -> np.ndarray:
     """
     if y_pred_proba.ndim == 2:
         # Interpret as probabilities.
-        y_pred = np.argmax(np.asarray(y_pred_proba), axis=1)
+        y_pred = np.argmax(y_pred_proba, axis=1)
     elif y_pred_proba.ndim == 1:
         # Interpret as class labels.
-        y_pred = np.asarray(y_pred_proba)
+        y_pred = y_pred_proba
     else:
         raise ValueError(f"Invalid shape of y_pred_proba: {y_pred_proba.shape}")
     return y_pred
 
 
+def _confusion_matrix(actual: np.ndarray, y_pred: np.ndarray) -> np.ndarray:
+    """Compute the confusion matrix (rows: actual, columns: predicted) over the union of labels found in ``actual``
+    and ``y_pred``, via a single `np.bincount` over a flat label index.
+
+    Args:
+        actual (np.ndarray): Actual class labels.
+        y_pred (np.ndarray): Predicted class labels.
+
+    Returns:
+        np.ndarray: The ``(n_classes, n_classes)`` confusion matrix.
+    """
+    actual = np.ravel(actual)
+    y_pred = np.ravel(y_pred)
+    _, encoded = np.unique(np.concatenate([actual, y_pred]), return_inverse=True)
+    n_classes = int(encoded.max()) + 1
+    n_samples = len(actual)
+    cm = np.bincount(
+        encoded[:n_samples] * n_classes + encoded[n_samples:],
+        minlength=n_classes * n_classes,
+    ).reshape(n_classes, n_classes)
+    return cm
+
+
+_last_cm_cache: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+"""Memo for `_confusion_matrix_cached`: copies of the last ``(actual, predicted)`` inputs and their ``cm``."""
+
+
+def _confusion_matrix_cached(actual: np.ndarray, predicted: np.ndarray) -> np.ndarray:
+    """Memoized wrapper around `_cast_to_y_pred` + `_confusion_matrix` for the last ``(actual, predicted)`` pair.
+
+    The evaluation loop calls every threshold metric on the same pair of arrays, so caching the last result lets all
+    of them share a single argmax and confusion matrix per fold. The cache is keyed on array *contents* (compared
+    with `np.array_equal` against defensive copies), so mutating an input in place between calls invalidates it
+    rather than returning a stale matrix; the comparison is a cheap linear pass next to the sort and argmax saved.
+
+    Args:
+        actual (np.ndarray): Actual class labels.
+        predicted (np.ndarray): Predicted probabilities (or class labels).
+
+    Returns:
+        np.ndarray: The ``(n_classes, n_classes)`` confusion matrix.
+    """
+    global _last_cm_cache  # pylint: disable=global-statement
+    if _last_cm_cache is not None:
+        cached_actual, cached_predicted, cached_cm = _last_cm_cache
+        if np.array_equal(cached_actual, actual) and np.array_equal(cached_predicted, predicted):
+            return cached_cm
+    cm = _confusion_matrix(actual, _cast_to_y_pred(predicted))
+    _last_cm_cache = (np.copy(actual), np.copy(predicted), cm)
+    return cm
+
+
+def _precision_recall_f1_from_cm(cm: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Derive per-class precision, recall and F1 from a confusion matrix, with zero division giving ``0``
+    (the equivalent of `sklearn`'s ``zero_division=0``).
+
+    Args:
+        cm (np.ndarray): The ``(n_classes, n_classes)`` confusion matrix.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+            Per-class ``(precision, recall, f1, support)`` arrays.
+    """
+    tp = np.diag(cm).astype(float)
+    fp = cm.sum(axis=0) - tp
+    fn = cm.sum(axis=1) - tp
+    support = cm.sum(axis=1)
+
+    precision = np.divide(tp, tp + fp, out=np.zeros_like(tp), where=(tp + fp) > 0)
+    recall = np.divide(tp, tp + fn, out=np.zeros_like(tp), where=(tp + fn) > 0)
+    f1 = np.divide(
+        2 * precision * recall,
+        precision + recall,
+        out=np.zeros_like(tp),
+        where=(precision + recall) > 0,
+    )
+    return precision, recall, f1, support
+
+
+def _average_per_class(per_class: np.ndarray, support: np.ndarray, average: str) -> float:
+    """Average per-class metric values using the ``"macro"`` (unweighted mean) or ``"weighted"``
+    (support-weighted mean) scheme.
+
+    Args:
+        per_class (np.ndarray): Per-class metric values.
+        support (np.ndarray): Per-class support (number of actual instances).
+        average (str): Averaging scheme, ``"macro"`` or ``"weighted"``.
+
+    Returns:
+        float: The averaged metric value.
+    """
+    if average == "macro":
+        return float(np.mean(per_class))
+    elif average == "weighted":
+        return float(np.average(per_class, weights=support))
+    else:
+        raise ValueError(f"Unsupported averaging scheme: {average}")
+
+
+def _accuracy_from_cm(cm: np.ndarray) -> float:
+    """Compute accuracy from a confusion matrix. Note that for the full-label confusion matrix this also equals the
+    micro-averaged precision, recall and F1 (the per-class false positive and false negative totals coincide).
+
+    Args:
+        cm (np.ndarray): The ``(n_classes, n_classes)`` confusion matrix.
+
+    Returns:
+        float: The accuracy score.
+    """
+    return float(np.trace(cm) / cm.sum())
+
+
+def _mcc_from_cm(cm: np.ndarray) -> float:
+    """Compute the Matthews Correlation Coefficient from a confusion matrix using its closed-form expression.
+    Returns ``0`` if the denominator is zero, as `sklearn` does.
+
+    Args:
+        cm (np.ndarray): The ``(n_classes, n_classes)`` confusion matrix.
+
+    Returns:
+        float: The MCC score.
+    """
+    cm = cm.astype(float)
+    n_correct = np.trace(cm)
+    n_samples = cm.sum()
+    pred_totals = cm.sum(axis=0)
+    true_totals = cm.sum(axis=1)
+
+    cov_ytyp = n_correct * n_samples - np.dot(pred_totals, true_totals)
+    cov_ypyp = n_samples**2 - np.dot(pred_totals, pred_totals)
+    cov_ytyt = n_samples**2 - np.dot(true_totals, true_totals)
+    denominator = np.sqrt(cov_ypyp * cov_ytyt)
+    if denominator == 0:
+        return 0.0
+    return float(cov_ytyp / denominator)
+
+
+def _kappa_from_cm(cm: np.ndarray, weights: Optional[str] = None) -> float:
+    """Compute Cohen's kappa from a confusion matrix, optionally with ``"quadratic"`` weighting,
+    mirroring the `sklearn` formulation.
+
+    Args:
+        cm (np.ndarray): The ``(n_classes, n_classes)`` confusion matrix.
+        weights (Optional[str], optional): Weighting scheme, `None` or ``"quadratic"``. Defaults to `None`.
+
+    Returns:
+        float: The kappa score.
+    """
+    n_classes = cm.shape[0]
+    pred_totals = cm.sum(axis=0)
+    true_totals = cm.sum(axis=1)
+    expected = np.outer(true_totals, pred_totals) / cm.sum()
+
+    if weights is None:
+        w_mat = np.ones((n_classes, n_classes))
+        np.fill_diagonal(w_mat, 0)
+    elif weights == "quadratic":
+        w_mat = np.zeros((n_classes, n_classes)) + np.arange(n_classes)
+        w_mat = (w_mat - w_mat.T) ** 2
+    else:
+        raise ValueError(f"Unsupported weighting scheme: {weights}")
+
+    k = np.sum(w_mat * cm) / np.sum(w_mat * expected)
+    return float(1 - k)
+
+
 def _get_y_pred_proba_hlpr(y_pred_proba: np.ndarray, nclasses: int) -> np.ndarray:
     """A helper utility for inferring the correct y_pred_proba for multiclass situations, specifically in the case
     of binary classification. See source code for the specifics.
@@ -76,21 +242,10 @@ def _evaluate_aucroc_multiclass(
     y_test, y_pred_proba_tmp, n_classes, classes = _prep_auc_multiclass(y_test, y_pred_proba)
 
     if n_classes > 2:
-        fpr = dict()
-        tpr = dict()
-        precision = dict()
-        recall = dict()
-        roc_auc: dict = dict()
-
         y_test = cast(np.ndarray, label_binarize(y_test, classes=classes, sparse_output=False))
 
-        fpr["micro"], tpr["micro"], _ = sklearn.metrics.roc_curve(y_test.ravel(), y_pred_proba_tmp.ravel())
-        roc_auc["micro"] = sklearn.metrics.auc(fpr["micro"], tpr["micro"])
-        precision["micro"], recall["micro"], _ = sklearn.metrics.precision_recall_curve(
-            y_test.ravel(), y_pred_proba_tmp.ravel()
-        )
-
-        aucroc = roc_auc["micro"]
+        fpr_micro, tpr_micro, _ = sklearn.metrics.roc_curve(y_test.ravel(), y_pred_proba_tmp.ravel())
+        aucroc = sklearn.metrics.auc(fpr_micro, tpr_micro)
     else:
         aucroc = sklearn.metrics.roc_auc_score(np.ravel(y_test), y_pred_proba_tmp, multi_class="ovr")
 
@@ -106,21 +261,9 @@ def _evaluate_aucprc_multiclass(
     y_test, y_pred_proba_tmp, n_classes, classes = _prep_auc_multiclass(y_test, y_pred_proba)
 
     if n_classes > 2:
-        fpr = dict()
-        tpr = dict()
-        precision = dict()
-        recall = dict()
-        average_precision = dict()
-
         y_test = cast(np.ndarray, label_binarize(y_test, classes=classes, sparse_output=False))
 
-        fpr["micro"], tpr["micro"], _ = sklearn.metrics.roc_curve(y_test.ravel(), y_pred_proba_tmp.ravel())
-        precision["micro"], recall["micro"], _ = sklearn.metrics.precision_recall_curve(
-            y_test.ravel(), y_pred_proba_tmp.ravel()
-        )
-        average_precision["micro"] = sklearn.metrics.average_precision_score(y_test, y_pred_proba_tmp, average="micro")
-
-        aucprc = average_precision["micro"]
+        aucprc = sklearn.metrics.average_precision_score(y_test, y_pred_proba_tmp, average="micro")
     else:
         aucprc = sklearn.metrics.average_precision_score(np.ravel(y_test), y_pred_proba_tmp)
 
@@ -136,10 +279,7 @@ class AccuracyOneOffClassificationMetric(metric.OneOffClassificationMetric):
         return "maximize"
 
     def _evaluate(self, actual: np.ndarray, predicted: np.ndarray, *args: Any, **kwargs: Any) -> float:
-        return cast(
-            float,
-            sklearn.metrics.accuracy_score(actual, _cast_to_y_pred(predicted)),
-        )
+        return _accuracy_from_cm(_confusion_matrix_cached(actual, predicted))
 
 
 @plugins.register_plugin(name="f1_score_micro", category="prediction.one_off.classification", plugin_type="metric")
@@ -153,15 +293,8 @@ class F1ScoreMicroOneOffClassificationMetric(metric.OneOffClassificationMetric):
         return "maximize"
 
     def _evaluate(self, actual: np.ndarray, predicted: np.ndarray, *args: Any, **kwargs: Any) -> float:
-        return cast(
-            float,
-            sklearn.metrics.f1_score(
-                actual,
-                _cast_to_y_pred(predicted),
-                average="micro",
-                zero_division=0,
-            ),
-        )
+        # Micro-averaged F1 over the full label set reduces to accuracy.
+        return _accuracy_from_cm(_confusion_matrix_cached(actual, predicted))
 
 
 @plugins.register_plugin(name="f1_score_macro", category="prediction.one_off.classification", plugin_type="metric")
@@ -175,15 +308,8 @@ class F1ScoreMacroOneOffClassificationMetric(metric.OneOffClassificationMetric):
         return "maximize"
 
     def _evaluate(self, actual: np.ndarray, predicted: np.ndarray, *args: Any, **kwargs: Any) -> float:
-        return cast(
-            float,
-            sklearn.metrics.f1_score(
-                actual,
-                _cast_to_y_pred(predicted),
-                average="macro",
-                zero_division=0,
-            ),
-        )
+        _, _, f1, support = _precision_recall_f1_from_cm(_confusion_matrix_cached(actual, predicted))
+        return _average_per_class(f1, support, average="macro")
 
 
 @plugins.register_plugin(name="f1_score_weighted", category="prediction.one_off.classification", plugin_type="metric")
@@ -197,15 +323,8 @@ class F1ScoreWeightedOneOffClassificationMetric(metric.OneOffClassificationMetri
         return "maximize"
 
     def _evaluate(self, actual: np.ndarray, predicted: np.ndarray, *args: Any, **kwargs: Any) -> float:
-        return cast(
-            float,
-            sklearn.metrics.f1_score(
-                actual,
-                _cast_to_y_pred(predicted),
-                average="weighted",
-                zero_division=0,
-            ),
-        )
+        _, _, f1, support = _precision_recall_f1_from_cm(_confusion_matrix_cached(actual, predicted))
+        return _average_per_class(f1, support, average="weighted")
 
 
 @plugins.register_plugin(name="kappa", category="prediction.one_off.classification", plugin_type="metric")
@@ -219,10 +338,7 @@ class KappaOneOffClassificationMetric(metric.OneOffClassificationMetric):
         return "maximize"
 
     def _evaluate(self, actual: np.ndarray, predicted: np.ndarray, *args: Any, **kwargs: Any) -> float:
-        return cast(
-            float,
-            sklearn.metrics.cohen_kappa_score(actual, _cast_to_y_pred(predicted)),
-        )
+        return _kappa_from_cm(_confusion_matrix_cached(actual, predicted))
 
 
 @plugins.register_plugin(name="kappa_quadratic", category="prediction.one_off.classification", plugin_type="metric")
@@ -236,10 +352,7 @@ class KappaQuadraticOneOffClassificationMetric(metric.OneOffClassificationMetric
         return "maximize"
 
     def _evaluate(self, actual: np.ndarray, predicted: np.ndarray, *args: Any, **kwargs: Any) -> float:
-        return cast(
-            float,
-            sklearn.metrics.cohen_kappa_score(actual, _cast_to_y_pred(predicted), weights="quadratic"),
-        )
+        return _kappa_from_cm(_confusion_matrix_cached(actual, predicted), weights="quadratic")
 
 
 @plugins.register_plugin(name="recall_micro", category="prediction.one_off.classification", plugin_type="metric")
@@ -253,15 +366,8 @@ class RecallMicroOneOffClassificationMetric(metric.OneOffClassificationMetric):
         return "maximize"
 
     def _evaluate(self, actual: np.ndarray, predicted: np.ndarray, *args: Any, **kwargs: Any) -> float:
-        return cast(
-            float,
-            sklearn.metrics.recall_score(
-                actual,
-                _cast_to_y_pred(predicted),
-                average="micro",
-                zero_division=0,
-            ),
-        )
+        # Micro-averaged recall over the full label set reduces to accuracy.
+        return _accuracy_from_cm(_confusion_matrix_cached(actual, predicted))
 
 
 @plugins.register_plugin(name="recall_macro", category="prediction.one_off.classification", plugin_type="metric")
@@ -275,15 +381,8 @@ class RecallMacroOneOffClassificationMetric(metric.OneOffClassificationMetric):
         return "maximize"
 
     def _evaluate(self, actual: np.ndarray, predicted: np.ndarray, *args: Any, **kwargs: Any) -> float:
-        return cast(
-            float,
-            sklearn.metrics.recall_score(
-                actual,
-                _cast_to_y_pred(predicted),
-                average="macro",
-                zero_division=0,
-            ),
-        )
+        _, recall, _, support = _precision_recall_f1_from_cm(_confusion_matrix_cached(actual, predicted))
+        return _average_per_class(recall, support, average="macro")
 
 
 @plugins.register_plugin(name="recall_weighted", category="prediction.one_off.classification", plugin_type="metric")
@@ -297,15 +396,8 @@ class RecallWeightedOneOffClassificationMetric(metric.OneOffClassificationMetric
         return "maximize"
 
     def _evaluate(self, actual: np.ndarray, predicted: np.ndarray, *args: Any, **kwargs: Any) -> float:
-        return cast(
-            float,
-            sklearn.metrics.recall_score(
-                actual,
-                _cast_to_y_pred(predicted),
-                average="weighted",
-                zero_division=0,
-            ),
-        )
+        _, recall, _, support = _precision_recall_f1_from_cm(_confusion_matrix_cached(actual, predicted))
+        return _average_per_class(recall, support, average="weighted")
 
 
 @plugins.register_plugin(name="precision_micro", category="prediction.one_off.classification", plugin_type="metric")
@@ -319,15 +411,8 @@ class PrecisionMicroOneOffClassificationMetric(metric.OneOffClassificationMetric
         return "maximize"
 
     def _evaluate(self, actual: np.ndarray, predicted: np.ndarray, *args: Any, **kwargs: Any) -> float:
-        return cast(
-            float,
-            sklearn.metrics.precision_score(
-                actual,
-                _cast_to_y_pred(predicted),
-                average="micro",
-                zero_division=0,
-            ),
-        )
+        # Micro-averaged precision over the full label set reduces to accuracy.
+        return _accuracy_from_cm(_confusion_matrix_cached(actual, predicted))
 
 
 @plugins.register_plugin(name="precision_macro", category="prediction.one_off.classification", plugin_type="metric")
@@ -341,15 +426,8 @@ class PrecisionMacroOneOffClassificationMetric(metric.OneOffClassificationMetric
         return "maximize"
 
     def _evaluate(self, actual: np.ndarray, predicted: np.ndarray, *args: Any, **kwargs: Any) -> float:
-        return cast(
-            float,
-            sklearn.metrics.precision_score(
-                actual,
-                _cast_to_y_pred(predicted),
-                average="macro",
-                zero_division=0,
-            ),
-        )
+        precision, _, _, support = _precision_recall_f1_from_cm(_confusion_matrix_cached(actual, predicted))
+        return _average_per_class(precision, support, average="macro")
 
 
 @plugins.register_plugin(name="precision_weighted", category="prediction.one_off.classification", plugin_type="metric")
@@ -364,15 +442,8 @@ class PrecisionWeightedOneOffClassificationMetric(metric.OneOffClassificationMet
         return "maximize"
 
     def _evaluate(self, actual: np.ndarray, predicted: np.ndarray, *args: Any, **kwargs: Any) -> float:
-        return cast(
-            float,
-            sklearn.metrics.precision_score(
-                actual,
-                _cast_to_y_pred(predicted),
-                average="weighted",
-                zero_division=0,
-            ),
-        )
+        precision, _, _, support = _precision_recall_f1_from_cm(_confusion_matrix_cached(actual, predicted))
+        return _average_per_class(precision, support, average="weighted")
 
 
 @plugins.register_plugin(name="mcc", category="prediction.one_off.classification", plugin_type="metric")
@@ -387,10 +458,7 @@ class MccOneOffClassificationMetric(metric.OneOffClassificationMetric):
         return "maximize"
 
     def _evaluate(self, actual: np.ndarray, predicted: np.ndarray, *args: Any, **kwargs: Any) -> float:
-        return cast(
-            float,
-            sklearn.metrics.matthews_corrcoef(actual, _cast_to_y_pred(predicted)),
-        )
+        return _mcc_from_cm(_confusion_matrix_cached(actual, predicted))
 
 
 @plugins.register_plugin(name="aucprc", category="prediction.one_off.classification", plugin_type="metric")
@@ -45,12 +45,13 @@ PREDICTOR_TIME_TO_EVENT = "time_to_event.dynamic_deephit"
     ],
 )
 @pytest.mark.parametrize("n_splits", [2])
+@pytest.mark.parametrize("n_jobs", [1, 2])
 def test_evaluate_prediction_oneoff_classifier(
-    model_template: Any, n_splits: int, data: str, request: pytest.FixtureRequest
+    model_template: Any, n_splits: int, n_jobs: int, data: str, request: pytest.FixtureRequest
 ) -> None:
     dataset = request.getfixturevalue(data)
 
-    scores = evaluate_prediction_oneoff_classifier(model_template, dataset, n_splits=n_splits, seed=0)
+    scores = evaluate_prediction_oneoff_classifier(model_template, dataset, n_splits=n_splits, seed=0, n_jobs=n_jobs)
 
     for out_metric in output_metrics:
         assert out_metric in scores
@@ -59,6 +60,31 @@ def test_evaluate_prediction_oneoff_classifier(
         assert metric in scores.index
 
 
+@pytest.mark.parametrize("data", TEST_ON_DATASETS_CLASSIFIER)
+def test_evaluate_prediction_oneoff_classifier_metrics_subset(data: str, request: pytest.FixtureRequest) -> None:
+    dataset = request.getfixturevalue(data)
+
+    metrics_to_evaluate = ["accuracy", "aucroc"]
+    scores = evaluate_prediction_oneoff_classifier(
+        plugin_loader.get(PREDICTOR_CLASSIFICATION, n_iter=N_ITER),
+        dataset,
+        n_splits=2,
+        seed=0,
+        metrics_to_evaluate=metrics_to_evaluate,
+    )
+
+    assert list(scores.index) == metrics_to_evaluate
+
+    with pytest.raises(ValueError, match=".*Unknown metric.*"):
+        evaluate_prediction_oneoff_classifier(
+            plugin_loader.get(PREDICTOR_CLASSIFICATION, n_iter=N_ITER),
+            dataset,
+            n_splits=2,
+            seed=0,
+            metrics_to_evaluate=["nonexistent_metric"],
+        )
+
+
 @pytest.mark.parametrize("data", TEST_ON_DATASETS_CLASSIFIER)
 @pytest.mark.parametrize("n_splits", [-1, 0, 1])
 def test_evaluate_prediction_oneoff_classifier_fail(n_splits: int, data: str, request: pytest.FixtureRequest) -> None:
@@ -144,12 +170,13 @@ def test_evaluate_prediction_oneoff_classifier_model_error(
     ],
 )
 @pytest.mark.parametrize("n_splits", [2])
+@pytest.mark.parametrize("n_jobs", [1, 2])
 def test_evaluate_prediction_oneoff_regressor(
-    model_template: Any, n_splits: int, data: str, request: pytest.FixtureRequest
+    model_template: Any, n_splits: int, n_jobs: int, data: str, request: pytest.FixtureRequest
 ) -> None:
     dataset = request.getfixturevalue(data)
 
-    scores = evaluate_prediction_oneoff_regressor(model_template, dataset, n_splits=n_splits, seed=0)
+    scores = evaluate_prediction_oneoff_regressor(model_template, dataset, n_splits=n_splits, seed=0, n_jobs=n_jobs)
 
     for out_metric in output_metrics:
         assert out_metric in scores